@@ -1,7 +1,18 @@
-import math
-
-from PyQt6.QtCore import QPoint, QTimer, Qt
-from PyQt6.QtGui import QColor, QFont, QPaintDevice, QPainter, QPen, QPixmap
+from math import cos as _cos, gcd, pi as _pi, sin as _sin
+from dataclasses import dataclass, field
+from time import monotonic
+
+import numpy as np
+from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QPaintDevice,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPolygon,
+)
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -17,119 +28,165 @@ from PyQt6.QtWidgets import (
 )
 
 
-class _QPoint(QPoint):
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-
-    def to_tuple(self) -> tuple[int, int]:
-        return self.x(), self.y()
-
-
-QPoint = _QPoint
-
-
-class Circle:
-    def __init__(self, radius: int = 20, color: QColor = QColor("black")) -> None:
-        self._radius: int = radius
-
-        self._color: QColor = color
+# Scalar per-tick math goes through math; numpy is only for whole-curve batches.
+FRAME_TIME: float = 1 / 240
 
-        self._pos: QPoint = QPoint(0, 0)
 
-    def get_radius(self) -> int:
-        return self._radius
+def _rotate(
+    cos: float, sin: float, step_cos: float, step_sin: float
+) -> tuple[float, float]:
+    return cos * step_cos - sin * step_sin, sin * step_cos + cos * step_sin
 
-    def set_radius(self, radius: int) -> None:
-        self._radius = radius
 
-    def get_color(self) -> QColor:
-        return self._color
+def _compute_state(
+    path_radius: int,
+    inner_radius: int,
+    cos_a: float,
+    sin_a: float,
+    cos_b: float,
+    sin_b: float,
+) -> tuple[int, int, int, int]:
+    inner_x: float = path_radius * cos_a
+    inner_y: float = path_radius * sin_a
 
-    def set_color(self, color: QColor) -> None:
-        self._color = color
+    return (
+        int(inner_x),
+        int(inner_y),
+        int(inner_x + inner_radius * cos_b),
+        int(inner_y - inner_radius * sin_b),
+    )
 
-    def get_pos(self) -> QPoint:
-        return self._pos
 
-    def set_pos(self, pos: QPoint) -> None:
-        self._pos = pos
+@dataclass(slots=True)
+class Circle:
+    radius: int = 20
+    color: QColor = field(default_factory=lambda: QColor("black"))
+    pos: tuple[int, int] = (0, 0)
 
 
 class CircularMove:
     _period: float
-    _angular_velocity: float
     _velocity: float
     _acceleration: float
+    _step_cos: float
+    _step_sin: float
 
-    def __init__(self, radius: int, period: float, subject: Circle) -> None:
-        self._radius: int = radius
+    angular_velocity: float
 
-        self.set_period(period)
+    def __init__(self, radius: int, period: float, subject: Circle) -> None:
+        self.radius: int = radius
+        self.subject: Circle = subject
 
-        self._subject: Circle = subject
+        self._cos: float = 1.0
+        self._sin: float = 0.0
 
-    def set_radius(self, radius: int) -> None:
-        self._radius = radius
+        self.period = period
 
-    def get_period(self) -> float:
+    @property
+    def period(self) -> float:
         return self._period
 
-    def set_period(self, period: float) -> None:
+    @period.setter
+    def period(self, period: float) -> None:
         self._period = period
 
-        self._angular_velocity = 2 * math.pi / period
-        self._velocity = self._angular_velocity * self._radius
-        self._acceleration = self._angular_velocity**2 * self._radius
+        self.angular_velocity = 2 * _pi / period
+        self._velocity = self.angular_velocity * self.radius
+        self._acceleration = self.angular_velocity**2 * self.radius
 
-    def get_angular_velocity(self) -> float:
-        return self._angular_velocity
+        self._step_cos = _cos(self.angular_velocity * FRAME_TIME)
+        self._step_sin = _sin(self.angular_velocity * FRAME_TIME)
 
-    def recalculate_subject_pos(self, time: float) -> None:
-        point: QPoint = QPoint(
-            int(self._radius * math.cos(self._angular_velocity * time)),
-            int(self._radius * math.sin(self._angular_velocity * time)),
-        )
+    def get_phase(self) -> tuple[float, float]:
+        return self._cos, self._sin
+
+    def sync(self, time: float) -> None:
+        self._cos = _cos(self.angular_velocity * time)
+        self._sin = _sin(self.angular_velocity * time)
 
-        self._subject.set_pos(point)
+    def advance(self) -> None:
+        self._cos, self._sin = _rotate(
+            self._cos, self._sin, self._step_cos, self._step_sin
+        )
 
 
 class Hypocycloid:
+    _k: float
+    _k_minus_1: float
+
     def __init__(self, outer_circle: Circle, inner_circle: Circle) -> None:
         self._outer_circle: Circle = outer_circle
         self._inner_circle: Circle = inner_circle
 
-        self._hypocycloid_point: QPoint = QPoint(0, 0)
-
-    def get_hypocycloid_point(self) -> QPoint:
-        return self._hypocycloid_point
-
-    def _get_k(self) -> float:
-        return self._outer_circle.get_radius() / self._inner_circle.get_radius()
-
-    def recalculate_hypocycloid_point(
-        self, angular_velocity: float, time: float
-    ) -> None:
-        self._hypocycloid_point = QPoint(
-            int(
-                self._inner_circle.get_radius()
-                * (self._get_k() - 1)
-                * math.cos(angular_velocity * time)
-                + self._inner_circle.get_radius()
-                * math.cos((self._get_k() - 1) * angular_velocity * time)
-            ),
-            int(
-                self._inner_circle.get_radius()
-                * (self._get_k() - 1)
-                * math.sin(angular_velocity * time)
-                - self._inner_circle.get_radius()
-                * math.sin((self._get_k() - 1) * angular_velocity * time)
-            ),
+        self._update_ratio()
+
+        self._cos: float = 1.0
+        self._sin: float = 0.0
+
+        self._step_cos: float = 1.0
+        self._step_sin: float = 0.0
+
+        self.hypocycloid_point: tuple[int, int] = (0, 0)
+
+    def get_phase(self) -> tuple[float, float]:
+        return self._cos, self._sin
+
+    def sync(self, angular_velocity: float, time: float) -> None:
+        rolling_velocity: float = self._k_minus_1 * angular_velocity
+
+        self._cos = _cos(rolling_velocity * time)
+        self._sin = _sin(rolling_velocity * time)
+
+        self._step_cos = _cos(rolling_velocity * FRAME_TIME)
+        self._step_sin = _sin(rolling_velocity * FRAME_TIME)
+
+    def advance(self) -> None:
+        self._cos, self._sin = _rotate(
+            self._cos, self._sin, self._step_cos, self._step_sin
+        )
+
+    def set_inner_radius(self, radius: int) -> None:
+        self._inner_circle.radius = radius
+
+        self._update_ratio()
+
+    def set_outer_radius(self, radius: int) -> None:
+        self._outer_circle.radius = radius
+
+        self._update_ratio()
+
+    def _update_ratio(self) -> None:
+        self._k = self._outer_circle.radius / self._inner_circle.radius
+        self._k_minus_1 = self._k - 1
+
+    def get_curve(self) -> tuple[np.ndarray, np.ndarray]:
+        outer_radius: int = self._outer_circle.radius
+        inner_radius: int = self._inner_circle.radius
+        path_radius: int = outer_radius - inner_radius
+
+        loops: int = inner_radius // gcd(outer_radius, inner_radius)
+        samples_per_loop: int = int(2 * _pi * path_radius) + 1
+
+        theta: np.ndarray = np.linspace(
+            0.0, 2 * _pi * loops, loops * samples_per_loop + 1
+        )
+
+        x: np.ndarray = path_radius * np.cos(theta) + inner_radius * np.cos(
+            self._k_minus_1 * theta
+        )
+        y: np.ndarray = path_radius * np.sin(theta) - inner_radius * np.sin(
+            self._k_minus_1 * theta
         )
 
+        return x, y
+
 
 class Canvas(QLabel):
     size: tuple[int, int] = (720, 480)
-    _background_color: tuple[int, int, int] = (255, 240, 240)
+    _half_width: int = size[0] // 2
+    _half_height: int = size[1] // 2
+    _background_color: QColor = QColor(255, 240, 240)
+    _transparent_color: QColor = QColor(0, 0, 0, 0)
 
     def __init__(
         self,
@@ -143,109 +200,120 @@ class Canvas(QLabel):
 
         self.setFixedSize(*Canvas.size)
 
-        _canvas: QPixmap = QPixmap(*Canvas.size)
-        _canvas.fill(QColor(*Canvas._background_color))
-
+        self.static_canvas: QPixmap = QPixmap(*Canvas.size)
         self.hypocycloid_canvas: QPixmap = QPixmap(*Canvas.size)
-        self.hypocycloid_canvas.fill(QColor(0, 0, 0, 0))
-
-        self.setPixmap(_canvas)
 
         self.outer_circle: Circle = outer_circle
         self.inner_circle: Circle = inner_circle
         self.hypocycloid: Hypocycloid = hypocycloid
         self.interactive: bool = True
         self.show_hypocycloid: bool = False
+        self.hypocycloid_stale: bool = True
 
-        self.redraw_timeout()
+        self._pen_inner: QPen = Canvas.construct_pen(self.inner_circle.color)
 
-    def clear(self):
-        canvas = self.pixmap()
-        canvas.fill(QColor(*Canvas._background_color))
-        self.setPixmap(canvas)
+        self.redraw_static_canvas()
+        self.redraw_timeout()
 
-    def redraw_timeout(self):
-        self.clear()
+    def redraw_static_canvas(self):
+        self.static_canvas.fill(Canvas._background_color)
 
-        canvas: QPixmap = self.pixmap()
         painter: QPainter = Canvas.construct_painter(
-            self.inner_circle.get_color(), canvas
+            Canvas.construct_pen(self.outer_circle.color), self.static_canvas
         )
 
-        outer_circle_diameter: int = self.outer_circle.get_radius() * 2
-        outer_circle_pos = Canvas.get_absolute_pos(
-            self.outer_circle.get_pos(), (outer_circle_diameter, outer_circle_diameter)
-        )
+        outer_circle_radius: int = self.outer_circle.radius
+        outer_circle_diameter: int = outer_circle_radius << 1
+        outer_circle_x, outer_circle_y = Canvas._to_abs(*self.outer_circle.pos)
 
         painter.drawEllipse(
-            *outer_circle_pos.to_tuple(), outer_circle_diameter, outer_circle_diameter
+            outer_circle_x - outer_circle_radius,
+            outer_circle_y - outer_circle_radius,
+            outer_circle_diameter,
+            outer_circle_diameter,
         )
 
-        inner_circle_diameter: int = self.inner_circle.get_radius() * 2
-        inner_circle_pos = Canvas.get_absolute_pos(
-            self.inner_circle.get_pos(), (inner_circle_diameter, inner_circle_diameter)
-        )
+        painter.end()
+
+    def redraw_timeout(self):
+        canvas: QPixmap = QPixmap(self.static_canvas)
+        painter: QPainter = Canvas.construct_painter(self._pen_inner, canvas)
+
+        inner_circle_radius: int = self.inner_circle.radius
+        inner_circle_diameter: int = inner_circle_radius << 1
+        inner_circle_x, inner_circle_y = Canvas._to_abs(*self.inner_circle.pos)
 
         painter.drawEllipse(
-            *inner_circle_pos.to_tuple(), inner_circle_diameter, inner_circle_diameter
+            inner_circle_x - inner_circle_radius,
+            inner_circle_y - inner_circle_radius,
+            inner_circle_diameter,
+            inner_circle_diameter,
         )
 
         hypocycloid_point_diameter: int = 5
-        hypocycloid_point_pos: QPoint = Canvas.get_absolute_pos(
-            self.hypocycloid.get_hypocycloid_point(),
-            (hypocycloid_point_diameter, hypocycloid_point_diameter),
+        hypocycloid_point_radius: int = hypocycloid_point_diameter >> 1
+        hypocycloid_point_x, hypocycloid_point_y = Canvas._to_abs(
+            *self.hypocycloid.hypocycloid_point
         )
+
         painter.drawEllipse(
-            *hypocycloid_point_pos.to_tuple(),
+            hypocycloid_point_x - hypocycloid_point_radius,
+            hypocycloid_point_y - hypocycloid_point_radius,
             hypocycloid_point_diameter,
             hypocycloid_point_diameter,
         )
 
-        inner_circle_center_pos: QPoint = QPoint(
-            inner_circle_pos.x() + self.inner_circle.get_radius(),
-            inner_circle_pos.y() + self.inner_circle.get_radius(),
-        )
-        hypocycloid_point_center_pos: QPoint = QPoint(
-            hypocycloid_point_pos.x() + int(hypocycloid_point_diameter / 2),
-            hypocycloid_point_pos.y() + int(hypocycloid_point_diameter / 2),
-        )
         painter.drawLine(
-            *inner_circle_center_pos.to_tuple(),
-            *hypocycloid_point_center_pos.to_tuple(),
-        )
-
-        hypocycloid_painter = Canvas.construct_painter(
-            QColor("red"), self.hypocycloid_canvas
+            inner_circle_x, inner_circle_y, hypocycloid_point_x, hypocycloid_point_y
         )
-        hypocycloid_painter.drawEllipse(*hypocycloid_point_pos.to_tuple(), 3, 3)
-        hypocycloid_painter.end()
 
         if self.show_hypocycloid:
+            if self.hypocycloid_stale:
+                self.redraw_hypocycloid_canvas()
+
             painter.drawPixmap(0, 0, self.hypocycloid_canvas)
 
         painter.end()
         self.setPixmap(canvas)
 
-    def clear_hypocycloid_canvas(self):
-        self.hypocycloid_canvas.fill(QColor(0, 0, 0, 0))
+    def redraw_hypocycloid_canvas(self):
+        self.hypocycloid_canvas.fill(Canvas._transparent_color)
 
-    @staticmethod
-    def get_absolute_pos(
-        relative_pos: QPoint, subject_size: tuple[float, float]
-    ) -> QPoint:
-        return QPoint(
-            relative_pos.x() + int((Canvas.size[0] - subject_size[0]) / 2),
-            int((Canvas.size[1] - subject_size[1]) / 2) - relative_pos.y(),
+        x, y = self.hypocycloid.get_curve()
+
+        points: np.ndarray = np.column_stack(
+            (np.rint(x) + Canvas._half_width, Canvas._half_height - np.rint(y))
+        ).astype(int)
+
+        curve: QPolygon = QPolygon()
+        curve.setPoints(*points.ravel().tolist())
+
+        hypocycloid_painter = Canvas.construct_painter(
+            Canvas.construct_pen(QColor("red")),
+            self.hypocycloid_canvas,
+            antialias=False,
         )
+        hypocycloid_painter.drawPoints(curve)
+        hypocycloid_painter.end()
+
+        self.hypocycloid_stale = False
+
+    @staticmethod
+    def _to_abs(relative_x: int, relative_y: int) -> tuple[int, int]:
+        return Canvas._half_width + relative_x, Canvas._half_height - relative_y
+
+    @staticmethod
+    def construct_pen(color: QColor, width: int = 4) -> QPen:
+        return QPen(color, width, Qt.PenStyle.SolidLine)
 
     @staticmethod
     def construct_painter(
-        color: QColor, paint_device: QPaintDevice, width: int = 4
+        pen: QPen, paint_device: QPaintDevice, antialias: bool = True
     ) -> QPainter:
         painter = QPainter(paint_device)
 
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(QPen(color, width, Qt.PenStyle.SolidLine))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialias)
+        painter.setPen(pen)
 
         return painter
 
@@ -313,10 +381,13 @@ class InfoDialog(QDialog):
 
 
 class Circles(QMainWindow):
+    _resync_ticks: int = 240
+
     def __init__(self):
         super(Circles, self).__init__()
 
-        self.repaint_time: float = 0.0
+        self.repaint_ticks: int = 0
+        self._start_time: float = monotonic()
 
         self.setWindowTitle("2.21 Внутреннее качение окружности по окружности")
         self.setFixedSize(1280, 720)
@@ -325,22 +396,18 @@ class Circles(QMainWindow):
 
         central_widgets = QHBoxLayout()
 
-        outer_circle: Circle = Circle(
-            radius=int(Canvas.size[1] / 2), color=QColor("black")
-        )
+        outer_circle: Circle = Circle(radius=Canvas.size[1] >> 1, color=QColor("black"))
         inner_circle: Circle = Circle(radius=60, color=QColor("black"))
 
         self.circular_mover: CircularMove = CircularMove(
-            radius=outer_circle.get_radius() - inner_circle.get_radius(),
+            radius=outer_circle.radius - inner_circle.radius,
             period=5.0,
             subject=inner_circle,
         )
-        self.circular_mover.recalculate_subject_pos(0.0)
 
         self.hypocycloid: Hypocycloid = Hypocycloid(outer_circle, inner_circle)
-        self.hypocycloid.recalculate_hypocycloid_point(
-            self.circular_mover.get_angular_velocity(), 0.0
-        )
+
+        self.recalculate_state(0.0)
 
         self.canvas = Canvas(outer_circle, inner_circle, self.hypocycloid)
 
@@ -450,11 +517,14 @@ class Circles(QMainWindow):
         self.setCentralWidget(container)
 
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
 
         self.timer.timeout.connect(self.repaint_timeout)  # noqa
 
     def start_timer(self):
-        self.timer.start(int(1000 / 240))
+        self._start_time = monotonic() - self.repaint_ticks * FRAME_TIME
+
+        self.timer.start(int(1000 * FRAME_TIME))
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
 
@@ -463,34 +533,29 @@ class Circles(QMainWindow):
         InfoDialog().exec()
 
     def size_changed(self):
-        self.canvas.clear_hypocycloid_canvas()
-        self.canvas.inner_circle.set_radius(value := self.size_slider.value())
+        self.hypocycloid.set_inner_radius(value := self.size_slider.value())
+        self.canvas.hypocycloid_stale = True
 
-        self.circular_mover.set_radius(
-            self.canvas.outer_circle.get_radius()
-            - self.canvas.inner_circle.get_radius()
+        self.circular_mover.radius = (
+            self.canvas.outer_circle.radius - self.canvas.inner_circle.radius
         )
 
         self.size_slider_label.setText(f"Радиус внутренней окружности: {value}px")
 
-        time: float = self.repaint_time / 1000
+        time: float = self.repaint_ticks * FRAME_TIME
 
-        self.circular_mover.recalculate_subject_pos(time)
-        self.hypocycloid.recalculate_hypocycloid_point(
-            self.circular_mover.get_angular_velocity(), time
-        )
+        self.recalculate_state(time)
         self.canvas.redraw_timeout()
 
     def period_changed(self):
-        self.canvas.clear_hypocycloid_canvas()
-
-        self.repaint_time = 0.0
+        self.repaint_ticks = 0
+        self._start_time = monotonic()
 
         value = self.period_slider.value()
         if self.motion_direction_clockwise:
             value = -value
 
-        self.circular_mover.set_period(value)
+        self.circular_mover.period = value
 
         self.period_slider_label.setText(
             f"Период вращения внутренней окружности: {abs(value)}с"
@@ -498,10 +563,7 @@ class Circles(QMainWindow):
 
         time: float = 0.0
 
-        self.circular_mover.recalculate_subject_pos(time)
-        self.hypocycloid.recalculate_hypocycloid_point(
-            self.circular_mover.get_angular_velocity(), time
-        )
+        self.recalculate_state(time)
         self.canvas.redraw_timeout()
 
     def line_toggle(self):
@@ -514,16 +576,43 @@ class Circles(QMainWindow):
         self.period_changed()
 
     def repaint_timeout(self):
-        self.repaint_time += 1000 / 240
+        ticks: int = round((monotonic() - self._start_time) / FRAME_TIME)
 
-        time: float = self.repaint_time / 1000
+        if ticks == self.repaint_ticks:
+            return
+
+        if ticks != self.repaint_ticks + 1 or ticks % Circles._resync_ticks == 0:
+            self.recalculate_state(ticks * FRAME_TIME)
+        else:
+            self.advance_state()
+
+        self.repaint_ticks = ticks
 
-        self.circular_mover.recalculate_subject_pos(time)
-        self.hypocycloid.recalculate_hypocycloid_point(
-            self.circular_mover.get_angular_velocity(), time
-        )
         self.canvas.redraw_timeout()
 
+    def recalculate_state(self, time: float) -> None:
+        self.circular_mover.sync(time)
+        self.hypocycloid.sync(self.circular_mover.angular_velocity, time)
+
+        self._update_positions()
+
+    def advance_state(self) -> None:
+        self.circular_mover.advance()
+        self.hypocycloid.advance()
+
+        self._update_positions()
+
+    def _update_positions(self) -> None:
+        inner_x, inner_y, hypocycloid_x, hypocycloid_y = _compute_state(
+            self.circular_mover.radius,
+            self.circular_mover.subject.radius,
+            *self.circular_mover.get_phase(),
+            *self.hypocycloid.get_phase(),
+        )
+
+        self.circular_mover.subject.pos = inner_x, inner_y
+        self.hypocycloid.hypocycloid_point = hypocycloid_x, hypocycloid_y
+
     def stop_timer(self):
         self.timer.stop()
         self.start_button.setEnabled(True)
@@ -1,9 +1,9 @@
-import math
 from enum import Enum
 from random import randint
 from typing import Iterable
 
-from PyQt6.QtCore import QPoint, Qt
+import numpy as np
+from PyQt6.QtCore import QLine, QPoint, QTimer, Qt
 from PyQt6.QtGui import (
     QBrush,
     QColor,
@@ -11,6 +11,7 @@ from PyQt6.QtGui import (
     QPainter,
     QPen,
     QPixmap,
+    QPolygon,
     QFont,
 )
 from PyQt6.QtWidgets import (
@@ -25,59 +26,102 @@ from PyQt6.QtWidgets import (
     QDialog,
     QCheckBox,
 )
-from shapely.geometry import LineString, Point
 
 
-class Vector2D:
-    def __init__(self, x: float, y: float) -> None:
-        self._x: float = x
-        self._y: float = y
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
 
-    @property
-    def x(self) -> float:
-        return self._x
 
-    @x.setter
-    def x(self, x: float) -> None:
-        self._x = x
+def _dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 0] + u[..., 1] * v[..., 1]
 
-    @property
-    def y(self) -> float:
-        return self._y
 
-    @y.setter
-    def y(self, y: float) -> None:
-        self._y = y
+def _segments_intersect(
+    start: np.ndarray, end: np.ndarray, edge_starts: np.ndarray, edge_ends: np.ndarray
+) -> np.ndarray:
+    direction: np.ndarray = end - start
+    edge_directions: np.ndarray = edge_ends - edge_starts
 
-    def length(self) -> float:
-        return math.sqrt(self._x**2 + self._y**2)
+    d1: np.ndarray = np.sign(_cross(direction, edge_starts - start))
+    d2: np.ndarray = np.sign(_cross(direction, edge_ends - start))
+    d3: np.ndarray = np.sign(_cross(edge_directions, start - edge_starts))
+    d4: np.ndarray = np.sign(_cross(edge_directions, end - edge_starts))
 
-    def dot_product(self, other: "Vector2D") -> float:
-        return self.x * other.x + self.y * other.y
+    crossing: np.ndarray = (d1 * d2 < 0) & (d3 * d4 < 0)
 
-    def cross_product(self, other: "Vector2D") -> float:
-        return self.x * other.y - self.y * other.x
+    start_inside: np.ndarray = (d3 == 0) & (
+        _dot(start - edge_starts, edge_ends - start) > 0
+    )
+    end_inside: np.ndarray = (d4 == 0) & (_dot(end - edge_starts, edge_ends - end) > 0)
 
-    @staticmethod
-    def from_points(start: QPoint, end: QPoint) -> "Vector2D":
-        return Vector2D(
-            end.x() - start.x(),
-            end.y() - start.y(),
+    edge_start_inside: np.ndarray = (d1 == 0) & (
+        _dot(edge_starts - start, end - edge_starts) > 0
+    )
+    edge_end_inside: np.ndarray = (d2 == 0) & (
+        _dot(edge_ends - start, end - edge_ends) > 0
+    )
+
+    projected_starts: np.ndarray = _dot(edge_starts - start, direction)
+    projected_ends: np.ndarray = _dot(edge_ends - start, direction)
+
+    overlapping: np.ndarray = (
+        (d1 == 0)
+        & (d2 == 0)
+        & (
+            np.maximum(np.minimum(projected_starts, projected_ends), 0)
+            < np.minimum(
+                np.maximum(projected_starts, projected_ends), _dot(direction, direction)
+            )
         )
+    )
+
+    return (
+        crossing
+        | start_inside
+        | end_inside
+        | edge_start_inside
+        | edge_end_inside
+        | overlapping
+    )
+
+
+def _end_points_touch(
+    start: np.ndarray, end: np.ndarray, edge_starts: np.ndarray, edge_ends: np.ndarray
+) -> np.ndarray:
+    return (
+        (start == edge_starts).all(-1)
+        | (start == edge_ends).all(-1)
+        | (end == edge_starts).all(-1)
+        | (end == edge_ends).all(-1)
+    )
 
-    def __repr__(self) -> str:
-        return f"Vector <x: {self._x}, y: {self._y}>"
 
+def _is_clockwise(points: np.ndarray) -> bool:
+    return bool(_cross(points, np.roll(points, -1, axis=0)).sum() < 0)
 
-def left_turn(u: Vector2D, v: Vector2D) -> int:
-    _cross_product: float = u.cross_product(v)
 
-    if _cross_product < 0:
-        return -1
-    elif _cross_product == 0:
-        return 0
-    else:
-        return 1
+def _ear_blocked(triangle: np.ndarray, points: np.ndarray) -> bool:
+    previous, current, next_ = triangle
+
+    candidates: np.ndarray = points[
+        ((points >= triangle.min(0)) & (points <= triangle.max(0))).all(1)
+    ]
+    candidates = candidates[~(candidates[:, None] == triangle).all(-1).any(-1)]
+
+    if not len(candidates):
+        return False
+
+    cross_products: np.ndarray = np.sign(
+        np.stack(
+            (
+                _cross(current - candidates, next_ - current),
+                _cross(next_ - candidates, previous - next_),
+                _cross(previous - candidates, current - previous),
+            )
+        )
+    )
+
+    return bool(((cross_products >= 0).all(0) | (cross_products <= 0).all(0)).any())
 
 
 class VertexType(Enum):
@@ -89,6 +133,8 @@ class VertexType(Enum):
 
 
 class Vertex(QPoint):
+    __slots__ = ("_index", "_half_edge", "_type")
+
     def __init__(
             self, index: int, half_edge: "HalfEdge" = None, *args, **kwargs
     ) -> None:
@@ -132,6 +178,8 @@ class Vertex(QPoint):
 
 
 class HalfEdge:
+    __slots__ = ("_origin", "_next", "_previous", "_twin", "_face")
+
     def __init__(
         self,
         origin: Vertex = None,
@@ -216,11 +264,14 @@ class NotEnoughVertexesException(Exception):
 
 
 class Polygon:
+    _initial_capacity: int = 32
+
     def __init__(self, color: QColor = QColor("black")) -> None:
         self._first_vertex: Vertex | None = None
         self._last_vertex: Vertex | None = None
 
         self._vertex_count: int = 0
+        self._vertexes: list[Vertex] = list()
 
         self._color: QColor = color
 
@@ -228,6 +279,13 @@ class Polygon:
         self._clockwise: bool = True
 
         self._cuts: list[tuple[Vertex, Vertex]] = list()
+        self._triangulated: bool = False
+        self._self_intersecting: bool = False
+
+        self._points: np.ndarray = np.empty(
+            (Polygon._initial_capacity, 2), dtype=np.int64
+        )
+        self._positions: set[tuple[int, int]] | None = set()
 
     @property
     def color(self) -> QColor:
@@ -244,10 +302,13 @@ class Polygon:
         if self.is_closed():
             raise PolygonClosedException()
 
+        if (point.x(), point.y()) in self._get_positions():
+            raise SelfIntersectionException()
+
         new_vertex: Vertex = Vertex.from_point(self._vertex_count, point)
 
         if self._last_vertex is not None and self.intersects(
-            LineString([self._last_vertex.to_tuple(), new_vertex.to_tuple()])
+            self._last_vertex, new_vertex
         ):
             raise SelfIntersectionException()
 
@@ -275,8 +336,19 @@ class Polygon:
 
         self._last_vertex = new_vertex
 
+        if self._vertex_count == len(self._points):
+            self._points = np.concatenate((self._points, np.empty_like(self._points)))
+
+        self._points[self._vertex_count] = point.x(), point.y()
+        self._vertexes.append(new_vertex)
+
+        if self._positions is not None:
+            self._positions.add((point.x(), point.y()))
+
         self._vertex_count += 1
 
+        self._triangulated = False
+
     @property
     def vertex_count(self) -> int:
         return self._vertex_count
@@ -290,24 +362,10 @@ class Polygon:
         return self._last_vertex
 
     def iter_vertexes(self) -> Iterable[Vertex]:
-        current_vertex: Vertex = self._first_vertex
+        return iter(self._vertexes)
 
-        while True:
-            if current_vertex is None:
-                break
-
-            yield current_vertex
-
-            if current_vertex.half_edge.next is None:
-                break
-
-            if (
-                self.is_closed()
-                and self._first_vertex.half_edge.previous.origin is current_vertex
-            ):
-                break
-
-            current_vertex = current_vertex.half_edge.next.origin
+    def peek_vertexes(self) -> list[Vertex]:
+        return self._vertexes
 
     def peek_cuts(self) -> list[tuple[Vertex, Vertex]]:
         return self._cuts.copy()
@@ -316,9 +374,7 @@ class Polygon:
         if self.is_closed():
             raise PolygonClosedException()
 
-        if self.intersects(
-            LineString([self._last_vertex.to_tuple(), self._first_vertex.to_tuple()])
-        ):
+        if self.intersects(self._last_vertex, self._first_vertex):
             raise SelfIntersectionException()
 
         if self._vertex_count < 4:
@@ -341,205 +397,246 @@ class Polygon:
 
         self._closed = True
 
-        highest_vertex: Vertex = sorted(
-            self.iter_vertexes(),
-            key=lambda _vertex: (_vertex.y(), _vertex.x()),
-        )[0]
+        self._clockwise = _is_clockwise(self._get_points())
 
-        next_vertex: Vertex = highest_vertex.half_edge.next.origin
-        previous_vertex: Vertex = highest_vertex.half_edge.previous.origin
+        self._triangulated = False
 
-        vector_to_next: Vector2D = Vector2D.from_points(highest_vertex, next_vertex)
-        vector_to_previous: Vector2D = Vector2D.from_points(
-            highest_vertex, previous_vertex
-        )
+    def move_vertex(self, vertex: Vertex, point: QPoint) -> None:
+        vertex.setX(point.x())
+        vertex.setY(point.y())
+
+        self._points[vertex.index] = point.x(), point.y()
 
-        if left_turn(vector_to_next, vector_to_previous) == 1:
-            self._clockwise = False
+        self._invalidate()
+
+        self._self_intersecting = self.vertex_edges_intersect(vertex)
 
     def is_closed(self) -> bool:
         return self._closed
 
-    def intersects(self, line: LineString, no_vertexes: bool = True) -> bool:
-        edges: list[LineString] = list()
+    def _invalidate(self) -> None:
+        self._positions = None
+        self._triangulated = False
 
-        previous_vertex: Vertex | None = self._first_vertex
-        for current_vertex in self.iter_vertexes():
-            if current_vertex is self._first_vertex:
-                continue
+    def _get_points(self) -> np.ndarray:
+        return self._points[: self._vertex_count]
 
-            edges.append(
-                LineString([previous_vertex.to_tuple(), current_vertex.to_tuple()])
-            )
+    def _get_positions(self) -> set[tuple[int, int]]:
+        if self._positions is None:
+            self._positions = set(map(tuple, self._get_points().tolist()))
+
+        return self._positions
+
+    def vertex_near(self, point: QPoint, radius: int) -> Vertex | None:
+        offsets: np.ndarray = self._get_points() - (point.x(), point.y())
+        near: np.ndarray = _dot(offsets, offsets) <= radius * radius
+
+        if not near.any():
+            return None
+
+        return self._vertexes[int(near.argmax())]
 
-            previous_vertex = current_vertex
+    def _get_edges(self) -> tuple[np.ndarray, np.ndarray]:
+        points: np.ndarray = self._get_points()
 
-        for edge in edges:
-            intersection = line.intersection(edge)
+        if self.is_closed():
+            return points, np.roll(points, -1, axis=0)
+
+        return points[:-1], points[1:]
+
+    def vertex_edges_intersect(self, vertex: Vertex) -> bool:
+        edge_starts, edge_ends = self._get_edges()
+        edges: np.ndarray = np.arange(len(edge_starts))
 
-            if not intersection:
+        for edge in (vertex.index - 1) % self._vertex_count, vertex.index:
+            if edge >= len(edge_starts):
                 continue
 
-            if not no_vertexes:
+            if (edge_starts[edge] == edge_ends[edge]).all():
                 return True
 
-            point: tuple[int, int] = Point(int(intersection.x), int(intersection.y))
+            others: np.ndarray = edges != edge
 
-            if point in edge.boundary.geoms:
-                continue
+            if _segments_intersect(
+                edge_starts[edge],
+                edge_ends[edge],
+                edge_starts[others],
+                edge_ends[others],
+            ).any():
+                return True
 
-            return True
+            offsets: np.ndarray = np.abs(edges - edge)
+            distant: np.ndarray = (offsets > 1) & (
+                (not self.is_closed()) | (offsets < len(edges) - 1)
+            )
+
+            if _end_points_touch(
+                edge_starts[edge],
+                edge_ends[edge],
+                edge_starts[distant],
+                edge_ends[distant],
+            ).any():
+                return True
 
         return False
 
+    def has_self_intersections(self) -> bool:
+        if len(self._get_positions()) < self._vertex_count:
+            return True
+
+        edge_starts, edge_ends = self._get_edges()
+
+        hits: np.ndarray = _segments_intersect(
+            edge_starts[:, None], edge_ends[:, None], edge_starts, edge_ends
+        )
+
+        return bool(np.tril(hits | hits.T, -1).any())
+
+    def intersects(self, start: QPoint, end: QPoint) -> bool:
+        points: np.ndarray = self._get_points()
+
+        return bool(
+            _segments_intersect(
+                np.array((start.x(), start.y()), dtype=np.int64),
+                np.array((end.x(), end.y()), dtype=np.int64),
+                points[:-1],
+                points[1:],
+            ).any()
+        )
+
     def triangulate(self) -> None:
         if not self.is_closed():
             raise PolygonIsNotClosedException()
 
+        if self._triangulated:
+            return
+
         self._cuts.clear()
 
-        polygon: Polygon = Polygon()
+        if self._self_intersecting or self.has_self_intersections():
+            raise SelfIntersectionException()
 
-        for _vertex in self.iter_vertexes():
-            polygon.add_vertex(_vertex)
+        points: np.ndarray = self._get_points()
+        remaining: np.ndarray = np.ones(len(points), dtype=bool)
 
-        polygon.close()
+        coordinates: list[list[int]] = points.tolist()
 
-        current_vertex: Vertex = polygon._first_vertex
-        while polygon._vertex_count > 3:
-            next_vertex: Vertex = current_vertex.half_edge.next.origin
-            previous_vertex: Vertex = current_vertex.half_edge.previous.origin
+        self._clockwise = _is_clockwise(points)
 
-            current_to_next: Vector2D = Vector2D.from_points(
-                current_vertex, next_vertex
-            )
-            current_to_previous: Vector2D = Vector2D.from_points(
-                current_vertex, previous_vertex
-            )
+        turns: np.ndarray = _cross(
+            np.roll(points, -1, axis=0) - points, np.roll(points, 1, axis=0) - points
+        )
+        if not self._clockwise:
+            turns = -turns
 
-            predicate: int = left_turn(current_to_next, current_to_previous)
-            if not polygon._clockwise:
-                predicate *= -1
+        if (turns < 0).all():
+            last_vertex: Vertex = self._vertexes[-1]
 
-            if predicate == 1:
-                current_vertex = next_vertex
-                continue
+            self._cuts.extend((last_vertex, vertex) for vertex in self._vertexes[1:-2])
 
-            next_to_previous: Vector2D = Vector2D.from_points(
-                next_vertex, previous_vertex
-            )
-            previous_to_current: Vector2D = Vector2D.from_points(
-                previous_vertex, current_vertex
-            )
+            self._triangulated = True
+            return
 
-            for random_vertex in polygon.iter_vertexes():
-                if random_vertex in (previous_vertex, current_vertex, next_vertex):
-                    continue
+        vertex_count: int = self._vertex_count
 
-                random_to_current: Vector2D = Vector2D.from_points(
-                    random_vertex, current_vertex
-                )
-                random_to_next: Vector2D = Vector2D.from_points(
-                    random_vertex, next_vertex
-                )
-                random_to_previous: Vector2D = Vector2D.from_points(
-                    random_vertex, previous_vertex
-                )
+        next_indexes: list[int] = [*range(1, vertex_count), 0]
+        previous_indexes: list[int] = [vertex_count - 1, *range(vertex_count - 1)]
 
-                cross_products: list[float] = [
-                    random_to_current.cross_product(current_to_next),
-                    random_to_next.cross_product(next_to_previous),
-                    random_to_previous.cross_product(previous_to_current),
-                ]
+        current_index: int = 0
+        skipped: int = 0
+        while vertex_count > 3:
+            if skipped > vertex_count:
+                self._cuts.clear()
 
-                if 0 in cross_products:
-                    break
+                raise SelfIntersectionException()
 
-                if len({cross_product > 0 for cross_product in cross_products}) == 1:
-                    break
-            else:
-                polygon._vertex_count -= 1
+            next_index: int = next_indexes[current_index]
+            previous_index: int = previous_indexes[current_index]
 
-                if current_vertex is polygon._first_vertex:
-                    polygon._first_vertex = next_vertex
+            current_x, current_y = coordinates[current_index]
+            next_x, next_y = coordinates[next_index]
+            previous_x, previous_y = coordinates[previous_index]
 
-                previous_half_edge: HalfEdge = previous_vertex.half_edge
-                next_half_edge: HalfEdge = next_vertex.half_edge
+            predicate: int = (next_x - current_x) * (previous_y - current_y) - (
+                next_y - current_y
+            ) * (previous_x - current_x)
+            if not self._clockwise:
+                predicate = -predicate
 
-                previous_half_edge.next = next_half_edge
+            if predicate >= 0:
+                skipped += 1
 
-                next_half_edge.previous = previous_half_edge
+                current_index = next_index
+                continue
+
+            triangle: np.ndarray = points[[previous_index, current_index, next_index]]
 
-                previous_half_edge_twin: HalfEdge = previous_half_edge.twin
-                next_half_edge_twin: HalfEdge = next_half_edge.twin
+            if not _ear_blocked(triangle, points[remaining]):
+                vertex_count -= 1
+                remaining[current_index] = False
 
-                previous_half_edge_twin.origin = next_vertex
-                previous_half_edge_twin.previous = next_half_edge_twin
+                next_indexes[previous_index] = next_index
+                previous_indexes[next_index] = previous_index
 
-                next_half_edge_twin.next = previous_half_edge_twin
+                self._cuts.append(
+                    (self._vertexes[previous_index], self._vertexes[next_index])
+                )
+
+                skipped = 0
+            else:
+                skipped += 1
 
-                self._cuts.append((previous_vertex, next_vertex))
+            current_index = next_index
 
-            current_vertex = next_vertex
+        self._triangulated = True
 
     @staticmethod
     def random_polygon() -> "Polygon":
-        vertex_number: int = randint(10, 20)
+        rng: np.random.Generator = np.random.default_rng()
 
-        canvas_width, canvas_height = Canvas.get_size()
-
-        vertexes: list[QPoint] = list()
-        while len(vertexes) < vertex_number:
-            vertexes.append(QPoint(randint(0, canvas_width), randint(0, canvas_height)))
+        vertex_number: int = int(rng.integers(10, 20, endpoint=True))
 
-        leftmost_vertex: QPoint = vertexes[0]
-        rightmost_vertex: QPoint = vertexes[0]
+        canvas_width, canvas_height = Canvas.get_size()
 
-        for current_vertex in vertexes[1:]:
-            if current_vertex.x() < leftmost_vertex.x():
-                leftmost_vertex = current_vertex
+        cells: np.ndarray = rng.choice(
+            (canvas_width + 1) * (canvas_height + 1), vertex_number, replace=False
+        )
+        vertexes: np.ndarray = np.column_stack(np.divmod(cells, canvas_height + 1))
 
-            if current_vertex.x() > rightmost_vertex.x():
-                rightmost_vertex = current_vertex
+        leftmost_index: int = int(vertexes[:, 0].argmin())
+        rightmost_index: int = int(vertexes[:, 0].argmax())
 
-        above_line_vertexes: list[QPoint] = list()
-        below_line_vertexes: list[QPoint] = list()
+        leftmost_vertex: np.ndarray = vertexes[leftmost_index]
+        rightmost_vertex: np.ndarray = vertexes[rightmost_index]
 
-        vertexes.remove(leftmost_vertex)
-        vertexes.remove(rightmost_vertex)
+        vertexes = np.delete(vertexes, [leftmost_index, rightmost_index], axis=0)
 
-        for current_vertex in vertexes:
-            leftmost_to_current_vector: Vector2D = Vector2D(
-                current_vertex.x() - leftmost_vertex.x(),
-                current_vertex.y() - leftmost_vertex.y(),
-            )
-            leftmost_to_rightmost_vector: Vector2D = Vector2D(
-                rightmost_vertex.x() - leftmost_vertex.x(),
-                rightmost_vertex.y() - leftmost_vertex.y(),
-            )
-
-            vector_product: float = leftmost_to_current_vector.cross_product(
-                leftmost_to_rightmost_vector
-            )
+        above_line: np.ndarray = (
+            _cross(vertexes - leftmost_vertex, rightmost_vertex - leftmost_vertex) > 0
+        )
 
-            if vector_product > 0:
-                above_line_vertexes.append(current_vertex)
-            else:
-                below_line_vertexes.append(current_vertex)
+        above_line_vertexes: np.ndarray = vertexes[above_line]
+        below_line_vertexes: np.ndarray = vertexes[~above_line]
 
-        above_line_vertexes.sort(key=lambda p: p.x())
-        below_line_vertexes.sort(key=lambda p: p.x(), reverse=True)
+        above_line_vertexes = above_line_vertexes[
+            np.argsort(above_line_vertexes[:, 0], kind="stable")
+        ]
+        below_line_vertexes = below_line_vertexes[
+            np.argsort(-below_line_vertexes[:, 0], kind="stable")
+        ]
 
         polygon: Polygon = Polygon()
         polygon.set_random_color()
 
-        for current_vertex in (
-            leftmost_vertex,
-            *above_line_vertexes,
-            rightmost_vertex,
-            *below_line_vertexes,
-        ):
-            polygon.add_vertex(current_vertex)
+        for x, y in np.vstack(
+            (
+                leftmost_vertex,
+                above_line_vertexes,
+                rightmost_vertex,
+                below_line_vertexes,
+            )
+        ).tolist():
+            polygon.add_vertex(QPoint(x, y))
 
         polygon.close()
 
@@ -550,6 +647,13 @@ class Canvas(QLabel):
     _size: tuple[int, int] = (720, 480)
     _background_color: tuple[int, int, int] = (42, 42, 42)
 
+    _info_pen: QPen = QPen(QColor(255, 255, 255, 127), 4, Qt.PenStyle.SolidLine)
+    _guide_pen: QPen = QPen(QColor(255, 255, 255, 127), 2, Qt.PenStyle.DashDotDotLine)
+    _cut_pen: QPen = QPen(QColor("red"), 4, Qt.PenStyle.SolidLine)
+
+    _polygon_pen: QPen
+    _vertex_pen: QPen
+
     def __init__(
         self,
         raw_polygon: Polygon,
@@ -562,8 +666,10 @@ class Canvas(QLabel):
 
         self.setFixedSize(*Canvas._size)
 
-        _canvas: QPixmap = QPixmap(*Canvas._size)
-        _canvas.fill(QColor(*Canvas._background_color))
+        self._background: QPixmap = QPixmap(*Canvas._size)
+        self._background.fill(QColor(*Canvas._background_color))
+
+        self.place_grid()
 
         self._info_canvas: QPixmap = QPixmap(*Canvas._size)
         self._info_canvas.fill(QColor(0, 0, 0, 0))
@@ -571,19 +677,27 @@ class Canvas(QLabel):
         self._polygon_canvas: QPixmap = QPixmap(*Canvas._size)
         self._polygon_canvas.fill(QColor(0, 0, 0, 0))
 
-        self.setPixmap(_canvas)
-
-        self.place_grid()
+        self.setPixmap(QPixmap(self._background))
 
         self._triangulate_permanent: bool = False
 
         self._polygon: Polygon = raw_polygon
         self._triangles: list[Polygon] = list()
 
+        self._update_polygon_style()
+
+        self._info_font: QFont = QFont()
+        self._info_font.setPointSize(12)
+
         self._dragging_vertex: QPoint | None = None
 
         self._mouse_pos: QPoint | None = None
 
+        self._move_timer: QTimer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)  # noqa
+
     @classmethod
     def get_size(cls) -> tuple[int, int]:
         return cls._size
@@ -599,6 +713,8 @@ class Canvas(QLabel):
     def replace_polygon(self, new_polygon: Polygon) -> None:
         self._polygon = new_polygon
 
+        self._update_polygon_style()
+
         if self._polygon.is_closed():
             self._try_triangulate_polygon()
 
@@ -607,35 +723,42 @@ class Canvas(QLabel):
         self.redraw_canvas()
 
     def place_grid(self, grid_step: int = 30) -> None:
-        canvas: QPixmap = self.pixmap()
-        painter: QPainter = QPainter(canvas)
+        width, height = Canvas._size
+
+        horizontal_tile: QPixmap = QPixmap(grid_step, grid_step)
+        horizontal_tile.fill(QColor(0, 0, 0, 0))
+
+        vertical_tile: QPixmap = QPixmap(horizontal_tile)
+
+        for tile, lines in (
+            (
+                horizontal_tile,
+                [QLine(0, 0, grid_step, 0), QLine(0, grid_step, grid_step, grid_step)],
+            ),
+            (
+                vertical_tile,
+                [QLine(0, 0, 0, grid_step), QLine(grid_step, 0, grid_step, grid_step)],
+            ),
+        ):
+            painter: QPainter = QPainter(tile)
 
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(QPen(QColor(100, 100, 100, 40), 2, Qt.PenStyle.SolidLine))
-        painter.setBrush(QBrush(QColor(100, 100, 100, 40), Qt.BrushStyle.SolidPattern))
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(QPen(QColor(100, 100, 100, 40), 2, Qt.PenStyle.SolidLine))
 
-        for i in range(grid_step, Canvas._size[1], grid_step):
-            painter.drawLine(QPoint(0, i), QPoint(Canvas._size[0], i))
+            painter.drawLines(lines)
 
-        for i in range(grid_step, Canvas._size[0], grid_step):
-            painter.drawLine(QPoint(i, 0), QPoint(i, Canvas._size[1]))
+            painter.end()
 
-        painter.end()
-        self.setPixmap(canvas)
+        painter = QPainter(self._background)
 
-    def mousePressEvent(self, event: QMouseEvent) -> None:
-        def is_close(p: QPoint, q: QPoint, r: float) -> bool:
-            d: QPoint = p - q
+        painter.fillRect(0, 1, width, height - 2, QBrush(horizontal_tile))
+        painter.fillRect(1, 0, width - 2, height, QBrush(vertical_tile))
 
-            return d.x() ** 2 + d.y() ** 2 <= r**2
+        painter.end()
 
+    def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
-            closest_vertex: QPoint | None = None
-            for vertex in self._polygon.iter_vertexes():
-                if is_close(event.pos(), vertex, 5):
-                    closest_vertex = vertex
-
-                    break
+            closest_vertex: Vertex | None = self._polygon.vertex_near(event.pos(), 5)
 
             if closest_vertex is not None:
                 self._dragging_vertex = closest_vertex
@@ -658,26 +781,35 @@ class Canvas(QLabel):
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         self._mouse_pos = event.pos()
 
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_move(self) -> None:
         if self._dragging_vertex is not None:
-            self._dragging_vertex.setX(event.pos().x())
-            self._dragging_vertex.setY(event.pos().y())
+            self._polygon.move_vertex(self._dragging_vertex, self._mouse_pos)
 
+        if self.triangulate_permanent and self._polygon.is_closed():
+            self._try_triangulate_polygon(quiet=True)
+
+        if self._dragging_vertex is not None:
             self._update_polygon_canvas()
 
         self._update_info_canvas()
 
-        if self.triangulate_permanent and self._polygon.is_closed():
-            self._try_triangulate_polygon()
-
         self.redraw_canvas()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+
+            self._flush_move()
+
         if self._dragging_vertex is not None:
             self._dragging_vertex = None
 
             self._update_info_canvas()
 
-            if not self.triangulate_permanent and self._polygon.is_closed():
+            if self._polygon.is_closed():
                 self._try_triangulate_polygon()
 
             self._update_polygon_canvas()
@@ -717,7 +849,7 @@ class Canvas(QLabel):
                 message="Недостаточно точек для закрытия полигона. Их должно быть не менее 4."
             ).exec()
 
-    def _try_triangulate_polygon(self) -> None:
+    def _try_triangulate_polygon(self, quiet: bool = False) -> None:
         try:
             self._polygon.triangulate()
         except PolygonIsNotClosedException:
@@ -725,11 +857,24 @@ class Canvas(QLabel):
                 "Полигон не закрыт",
                 "Полигон не закрыт: невозможно запустить триангуляцию.\nЗакройте полигон и попробуйте снова.",
             ).exec()
+        except SelfIntersectionException:
+            if quiet:
+                return
 
-    def redraw_canvas(self) -> None:
-        self.clear_canvas()
+            Dialog(
+                "Проверка на самопересечения",
+                "Многоугольник самопересекается: невозможно запустить триангуляцию.\n"
+                "Измените геометрию полигона и повторите попытку.",
+            ).exec()
+
+    def _update_polygon_style(self) -> None:
+        self._polygon_pen = QPen(self._polygon.color, 4, Qt.PenStyle.SolidLine)
+        self._vertex_pen = QPen(
+            self._polygon.color, 8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap
+        )
 
-        canvas = self.pixmap()
+    def redraw_canvas(self) -> None:
+        canvas: QPixmap = QPixmap(self._background)
         painter: QPainter = QPainter(canvas)
 
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -748,16 +893,8 @@ class Canvas(QLabel):
         info_canvas_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         if self._mouse_pos is not None:
-            info_canvas_painter.setPen(
-                QPen(QColor(255, 255, 255, 127), 4, Qt.PenStyle.SolidLine)
-            )
-            info_canvas_painter.setBrush(
-                QBrush(QColor(255, 255, 255, 127), Qt.BrushStyle.SolidPattern)
-            )
-
-            font: QFont = QFont()
-            font.setPointSize(12)
-            info_canvas_painter.setFont(font)
+            info_canvas_painter.setPen(Canvas._info_pen)
+            info_canvas_painter.setFont(self._info_font)
 
             info_canvas_painter.drawText(
                 self._mouse_pos + QPoint(20, 20),
@@ -765,12 +902,7 @@ class Canvas(QLabel):
             )
 
         if self._dragging_vertex is not None:
-            info_canvas_painter.setPen(
-                QPen(QColor(255, 255, 255, 127), 2, Qt.PenStyle.DashDotDotLine)
-            )
-            info_canvas_painter.setBrush(
-                QBrush(QColor(255, 255, 255, 127), Qt.BrushStyle.SolidPattern)
-            )
+            info_canvas_painter.setPen(Canvas._guide_pen)
 
             info_canvas_painter.drawLine(
                 QPoint(self._dragging_vertex.x(), 0),
@@ -790,45 +922,30 @@ class Canvas(QLabel):
         polygon_canvas_painter: QPainter = QPainter(self._polygon_canvas)
 
         polygon_canvas_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        polygon_canvas_painter.setPen(
-            QPen(QColor(self._polygon.color), 4, Qt.PenStyle.SolidLine)
-        )
-        polygon_canvas_painter.setBrush(
-            QBrush(QColor(self._polygon.color), Qt.BrushStyle.SolidPattern)
-        )
 
-        previous_vertex: Vertex | None = None
-        for vertex in self._polygon.iter_vertexes():
-            polygon_canvas_painter.drawEllipse(vertex, 2, 2)
+        vertexes: list[Vertex] = self._polygon.peek_vertexes()
 
-            if previous_vertex is not None:
-                polygon_canvas_painter.drawLine(previous_vertex, vertex)
-
-            previous_vertex = vertex
+        edges: list[QLine] = [
+            QLine(start, end) for start, end in zip(vertexes, vertexes[1:])
+        ]
 
         if self._polygon.is_closed():
-            polygon_canvas_painter.drawLine(
-                self._polygon.last_vertex, self._polygon.first_vertex
-            )
+            edges.append(QLine(self._polygon.last_vertex, self._polygon.first_vertex))
+
+        polygon_canvas_painter.setPen(self._polygon_pen)
+        polygon_canvas_painter.drawLines(edges)
+
+        polygon_canvas_painter.setPen(self._vertex_pen)
+        polygon_canvas_painter.drawPoints(QPolygon(vertexes))
 
         if self._dragging_vertex is None or self.triangulate_permanent:
-            polygon_canvas_painter.setPen(QPen(QColor("red"), 4, Qt.PenStyle.SolidLine))
-            polygon_canvas_painter.setBrush(
-                QBrush(QColor("red"), Qt.BrushStyle.SolidPattern)
+            polygon_canvas_painter.setPen(Canvas._cut_pen)
+            polygon_canvas_painter.drawLines(
+                [QLine(start, end) for start, end in self._polygon.peek_cuts()]
             )
 
-            for cut in self._polygon.peek_cuts():
-                polygon_canvas_painter.drawLine(cut[0], cut[1])
-
         polygon_canvas_painter.end()
 
-    def clear_canvas(self) -> None:
-        canvas = self.pixmap()
-        canvas.fill(QColor(*Canvas._background_color))
-        self.setPixmap(canvas)
-
-        self.place_grid()
-
 
 class Dialog(QDialog):
     def __init__(
@@ -981,8 +1098,6 @@ class Cutting(QMainWindow):
         InfoDialog().exec()
 
     def clear_canvas(self) -> None:
-        self.canvas.clear_canvas()
-
         polygon: Polygon = Polygon()
         polygon.set_random_color()
 
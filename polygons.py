@@ -1,7 +1,8 @@
 from random import randint
 from typing import Callable, TypeVar, Tuple, List, Optional
 
-from PyQt6.QtCore import QPoint, Qt
+import numpy as np
+from PyQt6.QtCore import QLine, QPoint, QTimer, Qt
 from PyQt6.QtGui import (
     QBrush,
     QColor,
@@ -10,6 +11,7 @@ from PyQt6.QtGui import (
     QPainter,
     QPen,
     QPixmap,
+    QPolygon,
 )
 from PyQt6.QtWidgets import (
     QApplication,
@@ -22,9 +24,7 @@ from PyQt6.QtWidgets import (
     QWidget,
     QDialog,
 )
-from shapely.geometry import LineString
 
-QPolygon = TypeVar("QPolygon", bound=List[QPoint])
 OnClearCallback = TypeVar("OnClearCallback", bound=Callable[[], None])
 OnNewPointCallback = TypeVar("OnNewPointCallback", bound=Callable[[QPoint], None])
 OnPolygonCallback = TypeVar("OnPolygonCallback", bound=Callable[[List[QPoint]], None])
@@ -54,10 +54,18 @@ class Dialog(QDialog):
 class Canvas(QLabel):
     size: Tuple[int, int] = (720, 480)
     background_color: Tuple[int, int, int] = (42, 42, 42)
+    initial_capacity: int = 16
+
+    grid_pen: QPen = QPen(QColor(100, 100, 100, 40), 2, Qt.PenStyle.SolidLine)
+    intersection_pen: QPen = QPen(QColor("red"), 10, Qt.PenStyle.SolidLine)
 
     first_polygon_color: QColor
     second_polygon_color: QColor
 
+    polygon_pens: List[QPen]
+    polygon_brushes: List[QBrush]
+    vertex_pens: List[QPen]
+
     def __init__(
         self,
         *args,
@@ -67,26 +75,36 @@ class Canvas(QLabel):
 
         self.setFixedSize(*Canvas.size)
 
-        canvas: QPixmap = QPixmap(*Canvas.size)
-        canvas.fill(QColor(*Canvas.background_color))
+        self.background: QPixmap = QPixmap(*Canvas.size)
+        self.background.fill(QColor(*Canvas.background_color))
 
-        self.setPixmap(canvas)
+        self.place_grid()
+
+        self.setPixmap(QPixmap(self.background))
 
         self.set_random_color()
 
-        self.place_grid()
+        self.dragging_point: Optional[Tuple[int, int]] = None
+        self.drag_background: Optional[QPixmap] = None
 
-        self.previous_point: Optional[QPoint] = None
-        self.dragging_point: Optional[QPoint] = None
+        self.point_buffers: List[np.ndarray] = [
+            np.empty((Canvas.initial_capacity, 2), np.int64),
+            np.empty((Canvas.initial_capacity, 2), np.int64),
+        ]
 
-        self.first_polygon: Optional[QPolygon] = list()
-        self.second_polygon: Optional[QPolygon] = list()
+        self.polygons: List[np.ndarray] = [buffer[:0] for buffer in self.point_buffers]
 
-        self.current_polygon: Optional[QPolygon] = self.first_polygon
+        self.current_polygon: Optional[int] = 0
+
+        self.mouse_pos: Optional[QPoint] = None
+
+        self.move_timer: QTimer = QTimer(self)
+        self.move_timer.setSingleShot(True)
+        self.move_timer.setInterval(16)
+        self.move_timer.timeout.connect(self.flush_move)  # noqa
 
     def place_grid(self, grid_step: int = 30) -> None:
-        canvas = self.pixmap()
-        painter = construct_painter(QColor(100, 100, 100, alpha=40), canvas, 2)
+        painter = construct_painter(Canvas.grid_pen, self.background)
 
         for i in range(grid_step, Canvas.size[1], grid_step):
             painter.drawLine(QPoint(0, i), QPoint(Canvas.size[0], i))
@@ -95,7 +113,6 @@ class Canvas(QLabel):
             painter.drawLine(QPoint(i, 0), QPoint(i, Canvas.size[1]))
 
         painter.end()
-        self.setPixmap(canvas)
 
     def set_random_color(self) -> None:
         self.first_polygon_color = QColor(
@@ -106,105 +123,174 @@ class Canvas(QLabel):
             randint(0, 220), randint(0, 220), randint(0, 220)
         )
 
-    def mousePressEvent(self, event: QMouseEvent) -> None:
-        color = (
-            self.first_polygon_color
-            if self.current_polygon is self.first_polygon
-            else self.second_polygon_color
+        colors: Tuple[QColor, QColor] = (
+            self.first_polygon_color,
+            self.second_polygon_color,
         )
 
-        canvas: QPixmap = self.pixmap()
-        painter: QPainter = construct_painter(color, canvas)
-
-        def is_close(p: QPoint, q: QPoint, r: float) -> bool:
-            d: QPoint = p - q
-
-            return d.x() ** 2 + d.y() ** 2 <= r**2
+        self.polygon_pens = [QPen(color, 4, Qt.PenStyle.SolidLine) for color in colors]
+        self.polygon_brushes = [
+            QBrush(color, Qt.BrushStyle.SolidPattern) for color in colors
+        ]
+        self.vertex_pens = [
+            QPen(color, 8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+            for color in colors
+        ]
 
+    def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
-            closest_point: Optional[QPoint] = None
-            for previous_point in (*self.first_polygon, *self.second_polygon):
-                if is_close(event.pos(), previous_point, 5):
-                    closest_point = previous_point
-
-                    break
+            closest_point: Optional[Tuple[int, int]] = self.point_near(event.pos(), 5)
 
             if closest_point is not None:
                 self.set_drag_point(closest_point)
-            elif self.current_polygon is not None:
-                self.add_point(event.pos(), painter)
-        elif (
-            event.button() == Qt.MouseButton.RightButton
-            and self.current_polygon is not None
-        ):
+
+                return
+        elif event.button() != Qt.MouseButton.RightButton:
+            return
+
+        if self.current_polygon is None:
+            return
+
+        canvas: QPixmap = self.pixmap()
+        painter: QPainter = construct_painter(
+            self.polygon_pens[self.current_polygon],
+            canvas,
+            self.polygon_brushes[self.current_polygon],
+        )
+
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.add_point(event.pos(), painter)
+        else:
             self.close_polygon(painter)
 
+        if self.current_polygon is None:
+            self.calculate_intersections(painter)
+
         painter.end()
-        self.setPixmap(canvas)
 
-        if self.current_polygon is None:
-            self.calculate_intersections()
+        self.setPixmap(canvas)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self.dragging_point is None:
             return
 
-        canvas = self.pixmap()
-        canvas.fill(QColor(*Canvas.background_color))
-        self.setPixmap(canvas)
-        self.place_grid()
+        self.mouse_pos = event.pos()
+
+        if not self.move_timer.isActive():
+            self.move_timer.start()
 
-        for polygon in (self.first_polygon, self.second_polygon):
-            self.redraw_polygon(polygon, event.pos())
+    def flush_move(self) -> None:
+        polygon_index, point_index = self.dragging_point
+        self.polygons[polygon_index][point_index] = (
+            self.mouse_pos.x(),
+            self.mouse_pos.y(),
+        )
+
+        canvas: QPixmap = QPixmap(self.drag_background)
+        painter: QPainter = construct_painter(self.polygon_pens[polygon_index], canvas)
+
+        self.redraw_dragging_point(painter)
 
         if self.current_polygon is None:
-            self.calculate_intersections()
+            self.calculate_intersections(painter)
+
+        painter.end()
+
+        self.setPixmap(canvas)
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if self.move_timer.isActive():
+            self.move_timer.stop()
+
+            self.flush_move()
+
         if self.dragging_point is not None:
             self.dragging_point = None
+            self.drag_background = None
 
-    def redraw_polygon(self, polygon: QPolygon, new_point: QPoint) -> None:
-        color = (
-            self.first_polygon_color
-            if polygon is self.first_polygon
-            else self.second_polygon_color
-        )
+    def redraw_polygon(self, painter: QPainter, polygon_index: int) -> None:
+        points: List[QPoint] = [
+            QPoint(x, y) for x, y in self.polygons[polygon_index].tolist()
+        ]
 
-        canvas = self.pixmap()
-        painter: QPainter = construct_painter(color, canvas)
+        lines: List[QLine] = [
+            QLine(start, end) for start, end in zip(points, points[1:])
+        ]
 
-        previous_point: Optional[QPoint] = None
-        for index, point in enumerate(polygon.copy()):
-            if point is self.dragging_point:
-                point.setX(new_point.x())
-                point.setY(new_point.y())
+        if self.current_polygon != polygon_index and len(points) != 0:
+            lines.append(QLine(points[-1], points[0]))
 
-            painter.drawEllipse(point, 2, 2)
-            if previous_point is not None:
-                painter.drawLine(previous_point, point)
+        if self.dragging_point is not None and self.dragging_point[0] == polygon_index:
+            indexes: List[int] = self.get_dragging_indexes()
 
-            previous_point = point
+            lines = [
+                line for index, line in enumerate(lines) if index not in indexes[:-1]
+            ]
+            points = [
+                point for index, point in enumerate(points) if index not in indexes
+            ]
 
-        if self.current_polygon is not polygon and len(polygon) != 0:
-            painter.drawLine(previous_point, polygon[0])
+        painter.setPen(self.polygon_pens[polygon_index])
+        painter.drawLines(lines)
 
-        painter.end()
-        self.setPixmap(canvas)
+        painter.setPen(self.vertex_pens[polygon_index])
+        painter.drawPoints(QPolygon(points))
+
+    def get_dragging_indexes(self) -> List[int]:
+        polygon_index, point_index = self.dragging_point
+        point_count: int = len(self.polygons[polygon_index])
+
+        closed: bool = self.current_polygon != polygon_index
+
+        indexes: List[int] = [point_index]
+
+        if closed or point_index > 0:
+            indexes.insert(0, (point_index - 1) % point_count)
+
+        if closed or point_index < point_count - 1:
+            indexes.append((point_index + 1) % point_count)
+
+        return indexes
+
+    def redraw_dragging_point(self, painter: QPainter) -> None:
+        polygon_index: int = self.dragging_point[0]
+
+        polygon: np.ndarray = self.polygons[polygon_index][self.get_dragging_indexes()]
+
+        points: List[QPoint] = [QPoint(x, y) for x, y in polygon.tolist()]
+
+        painter.setPen(self.polygon_pens[polygon_index])
+        painter.drawLines([QLine(start, end) for start, end in zip(points, points[1:])])
+
+        painter.setPen(self.vertex_pens[polygon_index])
+        painter.drawPoints(QPolygon(points))
 
     def add_point(self, point: QPoint, painter: QPainter) -> None:
+        polygon: np.ndarray = self.polygons[self.current_polygon]
+
         painter.drawEllipse(point, 2, 2)
 
-        if self.previous_point is not None:
-            painter.drawLine(self.previous_point, point)
+        if len(polygon) != 0:
+            painter.drawLine(QPoint(*polygon[-1].tolist()), point)
 
-        self.current_polygon.append(point)
-        self.previous_point = point
+        buffer: np.ndarray = self.point_buffers[self.current_polygon]
+
+        if len(polygon) == len(buffer):
+            buffer = np.concatenate((buffer, np.empty_like(buffer)))
+
+            self.point_buffers[self.current_polygon] = buffer
+
+        buffer[len(polygon)] = point.x(), point.y()
+
+        self.polygons[self.current_polygon] = buffer[: len(polygon) + 1]
 
     def close_polygon(self, painter: QPainter) -> None:
-        if len(self.current_polygon) >= 3:
-            first_point: QPoint = QPoint(self.current_polygon[0])
-            painter.drawLine(self.previous_point, first_point)
+        polygon: np.ndarray = self.polygons[self.current_polygon]
+
+        if len(polygon) >= 3:
+            painter.drawLine(
+                QPoint(*polygon[-1].tolist()), QPoint(*polygon[0].tolist())
+            )
 
             self.next_polygon()
         else:
@@ -212,80 +298,130 @@ class Canvas(QLabel):
                 message="Недостаточно точек для закрытия полигона. Их должно быть не менее 3."
             ).exec()
 
-    def set_drag_point(self, point: QPoint) -> None:
+    def set_drag_point(self, point: Tuple[int, int]) -> None:
         self.dragging_point = point
 
-    def calculate_intersections(self) -> None:
-        intersections: List[QPoint] = list()
-
-        polygons: List[List[LineString]] = list()
+        self.drag_background = QPixmap(self.background)
 
-        for polygon in self.first_polygon, self.second_polygon:
-            polygons.append(current_sections := list())
-
-            previous_point: Tuple[int, int] = polygon[0].x(), polygon[0].y()
+        painter: QPainter = construct_painter(
+            self.polygon_pens[0], self.drag_background
+        )
 
-            for point in polygon[1:]:
-                current_point: Tuple[int, int] = point.x(), point.y()
+        for polygon_index in range(len(self.polygons)):
+            self.redraw_polygon(painter, polygon_index)
 
-                current_sections.append(LineString([previous_point, current_point]))
+        painter.end()
 
-                previous_point = current_point
+    def point_near(self, point: QPoint, radius: int) -> Optional[Tuple[int, int]]:
+        for polygon_index, polygon in enumerate(self.polygons):
+            distances: np.ndarray = ((polygon - (point.x(), point.y())) ** 2).sum(1)
+            near: np.ndarray = distances <= radius**2
 
-            current_point: Tuple[int, int] = polygon[0].x(), polygon[0].y()
-            current_sections.append(LineString([previous_point, current_point]))
+            if near.any():
+                return polygon_index, int(near.argmax())
 
-        for first_section in polygons[0]:
-            for second_section in polygons[1]:
-                if intersection := first_section.intersection(second_section):
-                    intersections.append(
-                        QPoint(int(intersection.x), int(intersection.y))
-                    )
+        return None
 
-        canvas = self.pixmap()
-        painter = construct_painter(QColor("red"), canvas, 10)
+    def calculate_intersections(self, painter: QPainter) -> None:
+        intersections: np.ndarray = intersect_polygons(*self.polygons)
 
-        for intersection in intersections:
-            painter.drawPoint(intersection)
+        painter.setPen(Canvas.intersection_pen)
 
-        painter.end()
-        self.setPixmap(canvas)
+        for x, y in intersections.tolist():
+            painter.drawPoint(x, y)
 
     def clear(self) -> None:
-        canvas = self.pixmap()
-        canvas.fill(QColor(*Canvas.background_color))
-        self.setPixmap(canvas)
-
-        self.place_grid()
+        self.setPixmap(QPixmap(self.background))
 
-        self.first_polygon.clear()
-        self.second_polygon.clear()
+        self.polygons = [buffer[:0] for buffer in self.point_buffers]
 
-        self.current_polygon = self.first_polygon
-
-        self.previous_point = None
+        self.current_polygon = 0
 
     def next_polygon(self) -> None:
         # points: List[Tuple[int, int]] = list()
         # for point in self.points:
         #     points.append((point.x(), point.y()))
 
-        if self.current_polygon is self.first_polygon:
-            self.current_polygon = self.second_polygon
+        if self.current_polygon == 0:
+            self.current_polygon = 1
         else:
             self.current_polygon = None
 
-        self.previous_point = None
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+
+def _dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 0] + u[..., 1] * v[..., 1]
+
+
+def intersect_polygons(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    p: np.ndarray = first[:, None]
+    r: np.ndarray = np.roll(first, -1, axis=0)[:, None] - p
+    q: np.ndarray = second[None]
+    s: np.ndarray = np.roll(second, -1, axis=0)[None] - q
+
+    q_p: np.ndarray = q - p
+
+    denominator: np.ndarray = _cross(r, s)
+    t: np.ndarray = _cross(q_p, s)
+    u: np.ndarray = _cross(q_p, r)
+
+    collinear: np.ndarray = (denominator == 0) & (u == 0)
+
+    sign: np.ndarray = np.sign(denominator)
+    denominator, t, u = denominator * sign, t * sign, u * sign
+
+    crossing: np.ndarray = (
+        (denominator != 0)
+        & (t >= 0)
+        & (t <= denominator)
+        & (u >= 0)
+        & (u <= denominator)
+    )
+
+    r_r: np.ndarray = _dot(r, r)
+    start: np.ndarray = _dot(q_p, r)
+    end: np.ndarray = start + _dot(s, r)
+
+    low: np.ndarray = np.maximum(np.minimum(start, end), 0)
+    high: np.ndarray = np.minimum(np.maximum(start, end), r_r)
+
+    overlapping: np.ndarray = collinear & (r_r != 0) & (low <= high)
+    spanning: np.ndarray = overlapping & (low < high)
+
+    r_r = np.broadcast_to(r_r, crossing.shape)
+
+    index: np.ndarray = np.concatenate(
+        (
+            np.nonzero(crossing)[0],
+            np.nonzero(overlapping)[0],
+            np.nonzero(spanning)[0],
+        )
+    )
+    numerator: np.ndarray = np.concatenate(
+        (t[crossing], low[overlapping], high[spanning])
+    )[:, None]
+    denominator = np.concatenate(
+        (denominator[crossing], r_r[overlapping], r_r[spanning])
+    )[:, None]
+
+    return np.trunc(
+        (first[index] * denominator + r[index, 0] * numerator) / denominator
+    ).astype(np.int64)
 
 
 def construct_painter(
-    color: QColor, paint_device: QPaintDevice, width: int = 4
+    pen: QPen, paint_device: QPaintDevice, brush: Optional[QBrush] = None
 ) -> QPainter:
     painter = QPainter(paint_device)
 
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    painter.setPen(QPen(color, width, Qt.PenStyle.SolidLine))
-    painter.setBrush(QBrush(color, Qt.BrushStyle.SolidPattern))
+    painter.setPen(pen)
+
+    if brush is not None:
+        painter.setBrush(brush)
 
     return painter
 
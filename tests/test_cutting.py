@@ -0,0 +1,54 @@
+import pytest
+from PyQt6.QtCore import QPoint
+
+from cutting import Polygon, SelfIntersectionException, Vertex
+
+
+def _polygon(points: list[tuple[int, int]]) -> Polygon:
+    polygon: Polygon = Polygon()
+
+    for x, y in points:
+        polygon.add_vertex(QPoint(x, y))
+
+    return polygon
+
+
+def test_add_vertex_rejects_edge_through_vertex() -> None:
+    polygon: Polygon = _polygon([(10, 0), (10, 10), (10, 20), (20, 10)])
+
+    with pytest.raises(SelfIntersectionException):
+        polygon.add_vertex(QPoint(0, 10))
+
+
+def test_move_vertex_detects_edge_through_vertex() -> None:
+    polygon: Polygon = _polygon([(0, 0), (20, 0), (20, 20), (10, 30), (0, 20)])
+    polygon.close()
+
+    vertex: Vertex = polygon.peek_vertexes()[0]
+    polygon.move_vertex(vertex, QPoint(40, 20))
+
+    assert polygon.vertex_edges_intersect(vertex)
+    assert polygon.has_self_intersections()
+
+
+def test_move_vertex_allows_shared_end_point() -> None:
+    polygon: Polygon = _polygon([(0, 0), (20, 0), (20, 20), (0, 20)])
+    polygon.close()
+
+    vertex: Vertex = polygon.peek_vertexes()[0]
+    polygon.move_vertex(vertex, QPoint(5, 5))
+
+    assert not polygon.vertex_edges_intersect(vertex)
+    assert not polygon.has_self_intersections()
+
+
+def test_move_vertex_detects_end_points_touching() -> None:
+    polygon: Polygon = _polygon(
+        [(0, 0), (20, 0), (30, 10), (20, 20), (0, 20), (-10, 10)]
+    )
+    polygon.close()
+
+    vertex: Vertex = polygon.peek_vertexes()[0]
+    polygon.move_vertex(vertex, QPoint(20, 20))
+
+    assert polygon.vertex_edges_intersect(vertex)